@@ -27,6 +27,9 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Commands that end the session
+QUIT_COMMANDS = frozenset({"quit", "exit", "q"})
+
 
 class TicketingCLI:
     """Command-line interface for the ticketing agent."""
@@ -43,6 +46,19 @@ class TicketingCLI:
         self.agent: Optional[TicketingAgent] = None
         self.running = True
         
+        # Static renderables are built once and reused on every display
+        self._welcome_panel = self._build_welcome_panel()
+        self._help_table = self._build_help_table()
+        
+        # Built-in commands, dispatched by exact match
+        self._commands = {
+            "help": self.display_help,
+            "clear": self.clear_history,
+            "history": self.display_history,
+            "test": self.run_test_scenarios,
+            "status": self.check_status,
+        }
+        
         # Initialize agent
         self._initialize_agent()
     
@@ -65,19 +81,19 @@ class TicketingCLI:
             self.console.print(f"[red]Unexpected error during initialization: {e}[/red]")
             sys.exit(1)
     
-    def display_welcome(self) -> None:
-        """Display welcome message."""
+    @staticmethod
+    def _build_welcome_panel() -> Panel:
+        """Build the welcome banner."""
         welcome_text = Text("🎫 Ticketing System AI Assistant", style="bold blue")
-        welcome_panel = Panel(
+        return Panel(
             welcome_text,
             subtitle="Type 'help' for commands, 'quit' to exit",
             border_style="blue"
         )
-        self.console.print(welcome_panel)
-        self.console.print(f"[dim]Connected to API: {self.api_base_url}[/dim]\n")
     
-    def display_help(self) -> None:
-        """Display help information."""
+    @staticmethod
+    def _build_help_table() -> Table:
+        """Build the table of available commands."""
         help_table = Table(title="Available Commands", border_style="green")
         help_table.add_column("Command", style="cyan", no_wrap=True)
         help_table.add_column("Description", style="white")
@@ -102,7 +118,17 @@ class TicketingCLI:
         for command, description in commands:
             help_table.add_row(command, description)
         
-        self.console.print(help_table)
+        return help_table
+    
+    def display_welcome(self) -> None:
+        """Display welcome message."""
+        with self.console:
+            self.console.print(self._welcome_panel)
+            self.console.print(f"[dim]Connected to API: {self.api_base_url}[/dim]\n")
+    
+    def display_help(self) -> None:
+        """Display help information."""
+        self.console.print(self._help_table)
     
     def check_status(self) -> None:
         """Check and display system status."""
@@ -151,12 +177,30 @@ class TicketingCLI:
                     border_style="green",
                     expand=False
                 )
-                self.console.print(response_panel)
-                self.console.print()  # Add spacing
+                # Buffer the panel and spacing so they go out in one write
+                with self.console:
+                    self.console.print(response_panel)
+                    self.console.print()  # Add spacing
                 
             except Exception as e:
                 self.console.print(f"[red]Error in test {i}: {str(e)}[/red]\n")
     
+    def clear_history(self) -> None:
+        """Clear the agent's conversation history."""
+        if self.agent:
+            self.agent.reset_conversation()
+            self.console.print("🧹 [green]Conversation history cleared.[/green]")
+        else:
+            self.console.print("[red]Agent not available[/red]")
+    
+    def display_history(self) -> None:
+        """Display a summary of the conversation so far."""
+        if self.agent:
+            summary = self.agent.get_conversation_summary()
+            self.console.print(Panel(summary, title="Conversation History", border_style="yellow"))
+        else:
+            self.console.print("[red]Agent not available[/red]")
+    
     def process_command(self, user_input: str) -> bool:
         """
         Process user commands and return False if should quit.
@@ -169,63 +213,44 @@ class TicketingCLI:
         """
         command = user_input.lower().strip()
         
-        if command in ['quit', 'exit', 'q']:
+        if command in QUIT_COMMANDS:
             self.console.print("👋 [bold blue]Goodbye![/bold blue]")
             return False
         
-        elif command == 'help':
-            self.display_help()
-            
-        elif command == 'clear':
-            if self.agent:
-                self.agent.reset_conversation()
-                self.console.print("🧹 [green]Conversation history cleared.[/green]")
-            else:
-                self.console.print("[red]Agent not available[/red]")
-            
-        elif command == 'history':
-            if self.agent:
-                summary = self.agent.get_conversation_summary()
-                self.console.print(Panel(summary, title="Conversation History", border_style="yellow"))
-            else:
-                self.console.print("[red]Agent not available[/red]")
-            
-        elif command == 'test':
-            self.run_test_scenarios()
-            
-        elif command == 'status':
-            self.check_status()
+        handler = self._commands.get(command)
+        if handler:
+            handler()
+            return True
+        
+        # Send to AI agent
+        if not self.agent:
+            self.console.print("[red]Agent not available. Please restart the application.[/red]")
+            return True
+        
+        try:
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=self.console,
+            ) as progress:
+                task = progress.add_task("🤖 Processing your request...", total=None)
+                response = self.agent.chat(user_input)
+                progress.remove_task(task)
             
-        else:
-            # Send to AI agent
-            if not self.agent:
-                self.console.print("[red]Agent not available. Please restart the application.[/red]")
-                return True
+            # Display response in a nice panel
+            response_panel = Panel(
+                response,
+                title="🤖 Assistant Response",
+                border_style="green",
+                expand=False
+            )
+            self.console.print(response_panel)
             
-            try:
-                with Progress(
-                    SpinnerColumn(),
-                    TextColumn("[progress.description]{task.description}"),
-                    console=self.console,
-                ) as progress:
-                    task = progress.add_task("🤖 Processing your request...", total=None)
-                    response = self.agent.chat(user_input)
-                    progress.remove_task(task)
-                
-                # Display response in a nice panel
-                response_panel = Panel(
-                    response,
-                    title="🤖 Assistant Response",
-                    border_style="green",
-                    expand=False
-                )
-                self.console.print(response_panel)
-                
-            except KeyboardInterrupt:
-                self.console.print("\n[yellow]Request cancelled by user[/yellow]")
-            except Exception as e:
-                self.console.print(f"[red]Error processing request: {str(e)}[/red]")
-                logger.error(f"Error in process_command: {e}", exc_info=True)
+        except KeyboardInterrupt:
+            self.console.print("\n[yellow]Request cancelled by user[/yellow]")
+        except Exception as e:
+            self.console.print(f"[red]Error processing request: {str(e)}[/red]")
+            logger.error(f"Error in process_command: {e}", exc_info=True)
         
         return True
     
@@ -1,7 +1,7 @@
 """
 Agent-specific configuration and constants.
 """
-from typing import Dict, Any, List
+from typing import Any, Dict, Tuple
 
 # System prompt for the conversational agent
 SYSTEM_PROMPT = """You are a helpful ticketing system assistant. You can help users manage support tickets through a ticketing API.
@@ -28,8 +28,9 @@ Important guidelines:
 
 Be conversational and helpful while being precise about technical details."""
 
-# Function definitions for the LLM
-FUNCTION_DEFINITIONS = [
+# Function definitions for the LLM (a tuple so the shared schema can't be
+# mutated by callers)
+FUNCTION_DEFINITIONS: Tuple[Dict[str, Any], ...] = (
     {
         "type": "function",
         "function": {
@@ -268,10 +269,26 @@ FUNCTION_DEFINITIONS = [
             }
         }
     }
-]
+)
+
+# Names of the functions advertised to the LLM
+FUNCTION_NAMES = frozenset(
+    definition["function"]["name"] for definition in FUNCTION_DEFINITIONS
+)
+
+# Allowed values of each enum-constrained argument, per function, so invalid
+# arguments can be rejected without a round-trip to the API
+FUNCTION_ENUM_ARGUMENTS: Dict[str, Dict[str, Tuple[str, ...]]] = {
+    definition["function"]["name"]: {
+        param: tuple(spec["enum"])
+        for param, spec in definition["function"]["parameters"]["properties"].items()
+        if "enum" in spec
+    }
+    for definition in FUNCTION_DEFINITIONS
+}
 
 # Test scenarios for validation
-TEST_SCENARIOS = [
+TEST_SCENARIOS: Tuple[str, ...] = (
     "Create a new ticket about a keyboard not working.",
     "Retrieve all open tickets.",
     "Get details for ticket ticket-001.",
@@ -283,4 +300,4 @@ TEST_SCENARIOS = [
     "What are common solutions for network connectivity problems?",
     "What are the trending issues this week?",
     "Find tickets similar to login authentication problems."
-]
+)
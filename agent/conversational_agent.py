@@ -1,16 +1,49 @@
 
 """Conversational AI agent for ticketing system interactions."""
-import json
 import logging
-from typing import List, Dict, Any, Optional
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
 
+import orjson
+
+from config.settings import agent_settings
 from .llm_client import AzureOpenAIClient, LLMClientError
 from .tools import TicketingTools, APIClient
-from .config import SYSTEM_PROMPT, FUNCTION_DEFINITIONS
+from .config import SYSTEM_PROMPT, FUNCTION_DEFINITIONS, FUNCTION_NAMES, FUNCTION_ENUM_ARGUMENTS
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Upper bound on tool calls from a single LLM response run at the same time
+MAX_CONCURRENT_TOOL_CALLS = 10
+
+# Functions with side effects. Repeated identical calls to them are all
+# executed, and other calls in the same LLM response may read what they
+# change, so responses containing them run in order.
+MODIFYING_FUNCTIONS = frozenset({
+    "create_ticket",
+    "create_ticket_with_recommendations",
+    "update_ticket",
+    "delete_ticket",
+})
+
+# How long a connection test result is reused before probing again
+CONNECTION_TEST_TTL = 5.0
+
+# Read-only commands from the CLI help that map to exactly one function. They
+# are answered directly, without an LLM round-trip. Ticket IDs are stored
+# in lower case, so a matched ID is lower-cased before it is looked up.
+DIRECT_COMMANDS = (
+    (re.compile(r"(?:get|show|list) all tickets", re.IGNORECASE),
+     lambda match: ("get_tickets", {})),
+    (re.compile(r"(?:get|show|list) (open|resolved|closed) tickets", re.IGNORECASE),
+     lambda match: ("get_tickets", {"status_filter": match[1].upper()})),
+    (re.compile(r"(?:get|show) ticket (ticket-[\w-]+)", re.IGNORECASE),
+     lambda match: ("get_ticket_by_id", {"ticket_id": match[1].lower()})),
+)
+
 
 class ConversationalAgentError(Exception):
     """Custom exception for conversational agent errors."""
@@ -31,19 +64,35 @@ class TicketingAgent:
             self.llm_client = AzureOpenAIClient()
             self.api_client = APIClient(api_base_url)
             self.ticketing_tools = TicketingTools(self.api_client)
-            self.conversation_history: List[Dict[str, Any]] = []
+            
+            # Tool method for each function advertised to the LLM
+            self._functions = {
+                name: getattr(self.ticketing_tools, name) for name in FUNCTION_NAMES
+            }
             
             self.system_message = {
                 "role": "system",
                 "content": SYSTEM_PROMPT
             }
             
-            logger.info(f"Initialized ticketing agent with API: {api_base_url}")
+            # Messages sent to the LLM: the system message followed by the
+            # conversation so far, kept as one list so it isn't rebuilt per call
+            self._messages: List[Dict[str, Any]] = [self.system_message]
+            
+            # (expiry time, result) of the last connection test
+            self._connection_test: Optional[Tuple[float, bool]] = None
+            
+            logger.info("Initialized ticketing agent with API: %s", api_base_url)
             
         except Exception as e:
-            logger.error(f"Failed to initialize ticketing agent: {e}")
+            logger.error("Failed to initialize ticketing agent: %s", e)
             raise ConversationalAgentError(f"Failed to initialize agent: {e}")
     
+    @property
+    def conversation_history(self) -> List[Dict[str, Any]]:
+        """Messages exchanged so far, excluding the system message."""
+        return self._messages[1:]
+    
     def _execute_function(self, function_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """
         Execute the requested function and return results.
@@ -56,40 +105,149 @@ class TicketingAgent:
             Function execution result
         """
         try:
-            logger.info(f"Executing function: {function_name} with args: {arguments}")
+            logger.info("Executing function: %s with args: %s", function_name, arguments)
             
-            if function_name == "create_ticket":
-                return self.ticketing_tools.create_ticket(**arguments)
-            elif function_name == "create_ticket_with_recommendations":
-                return self.ticketing_tools.create_ticket_with_recommendations(**arguments)
-            elif function_name == "get_recommendations":
-                return self.ticketing_tools.get_recommendations(**arguments)
-            elif function_name == "get_tickets":
-                return self.ticketing_tools.get_tickets(**arguments)
-            elif function_name == "get_ticket_by_id":
-                return self.ticketing_tools.get_ticket_by_id(**arguments)
-            elif function_name == "update_ticket":
-                return self.ticketing_tools.update_ticket(**arguments)
-            elif function_name == "delete_ticket":
-                return self.ticketing_tools.delete_ticket(**arguments)
-            elif function_name == "get_trending_issues":
-                return self.ticketing_tools.get_trending_issues(**arguments)
-            elif function_name == "search_similar_tickets":
-                return self.ticketing_tools.search_similar_tickets(**arguments)
-            else:
-                logger.error(f"Unknown function: {function_name}")
+            function = self._functions.get(function_name)
+            if function is None:
+                logger.error("Unknown function: %s", function_name)
                 return {
                     "success": False,
                     "message": f"Unknown function: {function_name}"
                 }
-                
+            
+            # The tools upper-case these values before sending them; empty
+            # values are left to the tools, which treat them as "no filter"
+            for param, allowed in FUNCTION_ENUM_ARGUMENTS[function_name].items():
+                value = arguments.get(param)
+                if value and str(value).upper() not in allowed:
+                    logger.warning("Invalid %s for %s: %s", param, function_name, value)
+                    return {
+                        "success": False,
+                        "message": f"Invalid {param} '{value}'. Must be one of: {', '.join(allowed)}"
+                    }
+            
+            return function(**arguments)
+            
         except Exception as e:
-            logger.error(f"Error executing {function_name}: {e}")
+            logger.error("Error executing %s: %s", function_name, e)
             return {
                 "success": False,
                 "message": f"Error executing {function_name}: {str(e)}"
             }
     
+    def _execute_functions(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Execute several function calls, overlapping their API round-trips.
+        
+        Args:
+            calls: (function name, arguments) pairs requested in one LLM response
+            
+        Returns:
+            Function execution results, in the same order as ``calls``
+        """
+        # Identical read-only calls are executed once and share the result,
+        # unless a modifying call comes between them
+        unique_calls: List[Tuple[str, Dict[str, Any]]] = []
+        positions = []
+        seen: Dict[Tuple[str, bytes], int] = {}
+        for name, args in calls:
+            if name in MODIFYING_FUNCTIONS:
+                seen.clear()
+            else:
+                key = (name, orjson.dumps(args, option=orjson.OPT_SORT_KEYS))
+                if key in seen:
+                    positions.append(seen[key])
+                    continue
+                seen[key] = len(unique_calls)
+            positions.append(len(unique_calls))
+            unique_calls.append((name, args))
+        
+        if len(unique_calls) == 1 or any(name in MODIFYING_FUNCTIONS for name, _ in unique_calls):
+            results = [self._execute_function(*call) for call in unique_calls]
+        else:
+            max_workers = min(len(unique_calls), MAX_CONCURRENT_TOOL_CALLS)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(lambda call: self._execute_function(*call), unique_calls))
+        
+        return [results[position] for position in positions]
+    
+    def _trim_history(self) -> None:
+        """Drop the oldest turns once the history outgrows the configured window."""
+        excess = len(self._messages) - 1 - agent_settings.max_history_messages
+        if excess <= 0:
+            return
+        
+        # Cut at the user message that starts the turn the window begins in,
+        # so no tool result is separated from the assistant message that
+        # requested it and the latest turn is always kept whole
+        start = excess + 1
+        while start > 1 and self._messages[start]["role"] != "user":
+            start -= 1
+        if start <= 1:
+            return
+        
+        logger.info("Dropping %d old messages from conversation history", start - 1)
+        del self._messages[1:start]
+    
+    @staticmethod
+    def _format_direct_result(result: Dict[str, Any]) -> str:
+        """Render the result of a direct command as a reply."""
+        if not result["success"]:
+            return result["message"]
+        
+        tickets = result["tickets"] if "tickets" in result else [result["ticket"]]
+        lines = [result["message"]]
+        for ticket in tickets:
+            lines.append(f"- {ticket['id']} [{ticket['status']}] {ticket['title']}")
+            if "ticket" in result:
+                lines.append(f"  {ticket['description']}")
+                if ticket.get("resolution"):
+                    lines.append(f"  Resolution: {ticket['resolution']}")
+        return "\n".join(lines)
+    
+    def _run_direct_command(self, function_name: str, arguments: Dict[str, Any]) -> str:
+        """
+        Execute a direct command and record it as a regular tool-call turn.
+        
+        Args:
+            function_name: Name of the function to execute
+            arguments: Function arguments
+            
+        Returns:
+            Agent's response
+        """
+        result = self._execute_function(function_name, arguments)
+        reply = self._format_direct_result(result)
+        
+        # Record the exchange the way the LLM would have, so later turns
+        # still see which function ran and what it returned
+        tool_call_id = f"direct-{len(self._messages)}"
+        self._messages.append({
+            "role": "assistant",
+            "content": None,
+            "tool_calls": [
+                {
+                    "id": tool_call_id,
+                    "type": "function",
+                    "function": {
+                        "name": function_name,
+                        "arguments": orjson.dumps(arguments).decode()
+                    }
+                }
+            ]
+        })
+        self._messages.append({
+            "role": "tool",
+            "tool_call_id": tool_call_id,
+            "content": orjson.dumps(result).decode()
+        })
+        self._messages.append({
+            "role": "assistant",
+            "content": reply
+        })
+        logger.info("Completed conversation turn with direct command %s", function_name)
+        return reply
+    
     def chat(self, user_message: str) -> str:
         """
         Process user message and return response.
@@ -101,27 +259,31 @@ class TicketingAgent:
             Agent's response
         """
         try:
-            logger.info(f"Processing user message: {user_message[:100]}...")
+            logger.info("Processing user message: %s...", user_message[:100])
             
-            # Add user message to conversation history
-            self.conversation_history.append({
+            # Keep the prompt bounded, then add user message to conversation history
+            self._trim_history()
+            self._messages.append({
                 "role": "user",
                 "content": user_message
             })
             
-            # Prepare messages for LLM
-            messages = [self.system_message] + self.conversation_history
+            command = user_message.strip()
+            for pattern, to_call in DIRECT_COMMANDS:
+                match = pattern.fullmatch(command)
+                if match:
+                    return self._run_direct_command(*to_call(match))
             
             # Get LLM response with function calling
             llm_response = self.llm_client.chat_completion(
-                messages=messages,
+                messages=self._messages,
                 tools=FUNCTION_DEFINITIONS
             )
             
             if not llm_response["success"]:
                 error_msg = f"LLM Error: {llm_response['error']}"
                 logger.error(error_msg)
-                self.conversation_history.append({
+                self._messages.append({
                     "role": "assistant",
                     "content": error_msg
                 })
@@ -132,10 +294,10 @@ class TicketingAgent:
             
             # Check if LLM wants to call functions
             if message.tool_calls:
-                logger.info(f"LLM requested {len(message.tool_calls)} function calls")
+                logger.info("LLM requested %d function calls", len(message.tool_calls))
                 
                 # Add the assistant's message with tool calls to history
-                self.conversation_history.append({
+                self._messages.append({
                     "role": "assistant",
                     "content": message.content,
                     "tool_calls": [
@@ -150,34 +312,35 @@ class TicketingAgent:
                     ]
                 })
                 
-                # Execute function calls
+                # Parse function calls
+                calls = []
                 for tool_call in message.tool_calls:
                     function_name = tool_call.function.name
                     try:
-                        function_args = json.loads(tool_call.function.arguments)
-                    except json.JSONDecodeError as e:
-                        logger.error(f"Invalid JSON in function arguments: {e}")
+                        function_args = orjson.loads(tool_call.function.arguments)
+                    except orjson.JSONDecodeError as e:
+                        logger.error("Invalid JSON in function arguments: %s", e)
                         function_args = {}
                     
-                    logger.info(f"Calling {function_name} with args: {function_args}")
-                    
-                    # Execute the function
-                    result = self._execute_function(function_name, function_args)
-                    
+                    calls.append((function_name, function_args))
+                
+                # Execute the functions
+                results = self._execute_functions(calls)
+                
+                for tool_call, result in zip(message.tool_calls, results):
                     # Add function result to conversation
-                    self.conversation_history.append({
+                    self._messages.append({
                         "role": "tool",
                         "tool_call_id": tool_call.id,
-                        "content": json.dumps(result)
+                        "content": orjson.dumps(result).decode()
                     })
                 
                 # Get final response from LLM after function execution
-                messages = [self.system_message] + self.conversation_history
-                final_response = self.llm_client.chat_completion(messages=messages)
+                final_response = self.llm_client.chat_completion(messages=self._messages)
                 
                 if final_response["success"]:
                     final_message = final_response["response"].choices[0].message.content
-                    self.conversation_history.append({
+                    self._messages.append({
                         "role": "assistant",
                         "content": final_message
                     })
@@ -186,7 +349,7 @@ class TicketingAgent:
                 else:
                     error_msg = f"Error getting final response: {final_response['error']}"
                     logger.error(error_msg)
-                    self.conversation_history.append({
+                    self._messages.append({
                         "role": "assistant", 
                         "content": error_msg
                     })
@@ -194,7 +357,7 @@ class TicketingAgent:
             else:
                 # No function calls, just return the message
                 response_content = message.content
-                self.conversation_history.append({
+                self._messages.append({
                     "role": "assistant",
                     "content": response_content
                 })
@@ -209,7 +372,7 @@ class TicketingAgent:
     def reset_conversation(self) -> None:
         """Reset the conversation history."""
         logger.info("Resetting conversation history")
-        self.conversation_history = []
+        del self._messages[1:]
     
     def get_conversation_summary(self) -> str:
         """
@@ -218,26 +381,26 @@ class TicketingAgent:
         Returns:
             Formatted conversation summary
         """
-        if not self.conversation_history:
+        history = self.conversation_history
+        if not history:
             return "No conversation history."
         
-        summary = f"Conversation with {len(self.conversation_history)} exchanges:\\n"
+        lines = [f"Conversation with {len(history)} exchanges:"]
         
         # Show last 6 messages
-        recent_messages = self.conversation_history[-6:]
-        for i, msg in enumerate(recent_messages, 1):
+        for i, msg in enumerate(history[-6:], 1):
             role = msg["role"].title()
             content = msg.get("content", "")
             
             if content:
                 preview = content[:100] + "..." if len(content) > 100 else content
-                summary += f"{i}. {role}: {preview}\\n"
+                lines.append(f"{i}. {role}: {preview}")
             elif msg.get("tool_calls"):
                 # Show function calls
                 tool_names = [tc["function"]["name"] for tc in msg["tool_calls"]]
-                summary += f"{i}. {role}: Called functions: {', '.join(tool_names)}\\n"
+                lines.append(f"{i}. {role}: Called functions: {', '.join(tool_names)}")
         
-        return summary
+        return "\n".join(lines)
     
     def test_connection(self) -> bool:
         """
@@ -246,24 +409,29 @@ class TicketingAgent:
         Returns:
             True if both connections are working
         """
+        if self._connection_test and self._connection_test[0] > time.monotonic():
+            return self._connection_test[1]
+        
         try:
             # Test LLM connection
             llm_ok = self.llm_client.test_connection()
             
-            # Test API connection
+            # Test API connection over the client's pooled session so the
+            # connection is reused by the requests that follow
             try:
-                import requests
-                response = requests.get(f"{self.api_client.base_url}/health", timeout=5)
+                response = self.api_client.session.get(f"{self.api_client.base_url}/health", timeout=5)
                 api_ok = response.status_code == 200
             except Exception as e:
-                logger.error(f"API connection test failed: {e}")
+                logger.error("API connection test failed: %s", e)
                 api_ok = False
             
-            logger.info(f"Connection test - LLM: {'OK' if llm_ok else 'FAILED'}, API: {'OK' if api_ok else 'FAILED'}")
-            return llm_ok and api_ok
+            logger.info("Connection test - LLM: %s, API: %s", 'OK' if llm_ok else 'FAILED', 'OK' if api_ok else 'FAILED')
+            connected = llm_ok and api_ok
+            self._connection_test = (time.monotonic() + CONNECTION_TEST_TTL, connected)
+            return connected
             
         except Exception as e:
-            logger.error(f"Connection test error: {e}")
+            logger.error("Connection test error: %s", e)
             return False
 
 
@@ -3,7 +3,8 @@
 Azure OpenAI client for LLM interactions.
 """
 import logging
-from typing import List, Dict, Any, Optional
+from functools import cached_property
+from typing import List, Dict, Any, Optional, Sequence
 
 import openai
 from openai.types.chat import ChatCompletion
@@ -24,16 +25,19 @@ class AzureOpenAIClient:
     
     def __init__(self):
         """Initialize the Azure OpenAI client."""
+        self.model = llm_settings.model
+        self.temperature = llm_settings.temperature
+        logger.info(f"Initialized Azure OpenAI client with model: {self.model}")
+    
+    @cached_property
+    def client(self) -> openai.AzureOpenAI:
+        """Underlying SDK client, created on first use and reused afterwards."""
         try:
-            self.client = openai.AzureOpenAI(
+            return openai.AzureOpenAI(
                 azure_endpoint=llm_settings.azure_endpoint,
                 api_key=llm_settings.api_key,
                 api_version=llm_settings.api_version
             )
-            self.model = llm_settings.model
-            self.temperature = llm_settings.temperature
-            logger.info(f"Initialized Azure OpenAI client with model: {self.model}")
-            
         except Exception as e:
             logger.error(f"Failed to initialize Azure OpenAI client: {e}")
             raise LLMClientError(f"Failed to initialize LLM client: {e}")
@@ -41,7 +45,7 @@ class AzureOpenAIClient:
     def chat_completion(
         self, 
         messages: List[Dict[str, str]], 
-        tools: Optional[List[Dict]] = None, 
+        tools: Optional[Sequence[Dict[str, Any]]] = None, 
         tool_choice: str = "auto"
     ) -> Dict[str, Any]:
         """
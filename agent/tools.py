@@ -2,23 +2,38 @@
 Tools for interacting with the ticketing API with AI recommendation support.
 """
 import logging
+import random
+import threading
 import time
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import orjson
 import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 from config.settings import agent_settings
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Successful GET responses are reused for a few seconds so an agent turn that
+# reads the same ticket or list twice only hits the API once
+GET_CACHE_TTL = 5.0
+GET_CACHE_MAX_SIZE = 256
+
+# Headers for request bodies APIClient encodes itself
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# A read timeout means the request body was already sent, so the server may
+# have acted on it; these methods are not resent in that case
+NON_IDEMPOTENT_METHODS = frozenset({"POST"})
+
+@dataclass(frozen=True)
 class RetryConfig:
     """Configuration for retry behavior."""
     max_retries: int = 3
     base_delay: float = 1.0
     backoff_factor: float = 2.0
+    connect_timeout: float = 3.0
+    read_timeout: float = 10.0
 
 class APIClientError(Exception):
     """Custom exception for API client errors."""
@@ -39,23 +54,40 @@ class APIClient:
         self.retry_config = retry_config or RetryConfig(
             max_retries=agent_settings.max_retries,
             base_delay=agent_settings.base_delay,
-            backoff_factor=agent_settings.backoff_factor
+            backoff_factor=agent_settings.backoff_factor,
+            connect_timeout=agent_settings.connect_timeout,
+            read_timeout=agent_settings.read_timeout
         )
         
-        # Configure session with connection pooling
+        # Backoff delay before each retry, computed once from the (frozen) config
+        self._retry_delays = tuple(
+            self.retry_config.base_delay * (self.retry_config.backoff_factor ** attempt)
+            for attempt in range(self.retry_config.max_retries)
+        )
+        
+        # Configure session with connection pooling. Retries are handled
+        # solely by _make_request_with_retry, so the transport adapters keep
+        # their default of not retrying.
         self.session = requests.Session()
+        self.session.headers["Accept"] = "application/json"
         
-        # Set up retry strategy for connection errors
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        # (endpoint, params) -> (expiry time, response)
+        self._get_cache: Dict[Tuple[str, Tuple], Tuple[float, requests.Response]] = {}
+        self._get_cache_lock = threading.Lock()
+        # Bumped by every write; a GET only caches its response if no write
+        # finished while it was in flight
+        self._write_generation = 0
         
-        logger.info(f"Initialized API client for {self.base_url}")
+        logger.info("Initialized API client for %s", self.base_url)
+    
+    def _sleep_before_retry(self, attempt: int) -> None:
+        """Wait out the backoff delay that follows a failed attempt."""
+        # Equal jitter: half the scheduled delay plus a random share of the
+        # other half, so clients that failed together don't retry in lockstep
+        half_delay = self._retry_delays[attempt] / 2
+        delay = half_delay + random.uniform(0, half_delay)
+        logger.info("Retrying in %.1fs...", delay)
+        time.sleep(delay)
     
     def _make_request_with_retry(self, method: str, url: str, **kwargs) -> requests.Response:
         """
@@ -70,43 +102,57 @@ class APIClient:
             Response object
             
         Raises:
-            APIClientError: If all retries are exhausted
+            APIClientError: If all retries are exhausted, or a non-idempotent
+                request times out waiting for a response
         """
         last_exception = None
         
+        # Bound every attempt so a stalled connection fails into a retry
+        kwargs.setdefault("timeout", (self.retry_config.connect_timeout, self.retry_config.read_timeout))
+        
         for attempt in range(self.retry_config.max_retries):
             try:
-                logger.debug(f"Making {method} request to {url} (attempt {attempt + 1})")
+                logger.debug("Making %s request to %s (attempt %d)", method, url, attempt + 1)
                 
                 response = self.session.request(method, url, **kwargs)
                 
                 # If we get a 5xx error, retry
                 if response.status_code >= 500:
-                    logger.warning(f"Server error {response.status_code} on attempt {attempt + 1}")
+                    logger.warning("Server error %d on attempt %d", response.status_code, attempt + 1)
                     
                     if attempt == self.retry_config.max_retries - 1:
-                        logger.error(f"All retries exhausted for {method} {url}")
+                        logger.error("All retries exhausted for %s %s", method, url)
                         return response  # Return the error response on final attempt
                     
-                    delay = self.retry_config.base_delay * (self.retry_config.backoff_factor ** attempt)
-                    logger.info(f"Retrying in {delay:.1f}s...")
-                    time.sleep(delay)
+                    self._sleep_before_retry(attempt)
                     continue
                 
-                logger.debug(f"Request successful: {response.status_code}")
+                logger.debug("Request successful: %s", response.status_code)
                 return response
                 
+            except requests.exceptions.ReadTimeout as e:
+                last_exception = e
+                logger.warning("Read timeout on attempt %d: %s", attempt + 1, e)
+                
+                if method in NON_IDEMPOTENT_METHODS:
+                    # Retrying could repeat a write the server already made
+                    raise APIClientError(f"{method} {url} timed out waiting for a response: {e}")
+                
+                if attempt == self.retry_config.max_retries - 1:
+                    logger.error("All retries exhausted due to exceptions")
+                    break
+                
+                self._sleep_before_retry(attempt)
+                
             except requests.exceptions.RequestException as e:
                 last_exception = e
-                logger.warning(f"Request exception on attempt {attempt + 1}: {e}")
+                logger.warning("Request exception on attempt %d: %s", attempt + 1, e)
                 
                 if attempt == self.retry_config.max_retries - 1:
-                    logger.error(f"All retries exhausted due to exceptions")
+                    logger.error("All retries exhausted due to exceptions")
                     break
                 
-                delay = self.retry_config.base_delay * (self.retry_config.backoff_factor ** attempt)
-                logger.info(f"Retrying in {delay:.1f}s...")
-                time.sleep(delay)
+                self._sleep_before_retry(attempt)
         
         if last_exception:
             raise APIClientError(f"Request failed after {self.retry_config.max_retries} attempts: {last_exception}")
@@ -114,25 +160,61 @@ class APIClient:
         # This shouldn't happen but just in case
         raise APIClientError(f"Request failed after {self.retry_config.max_retries} attempts")
     
+    def _make_write_request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
+        """Make a modifying request, dropping cached reads it may have made stale."""
+        if "json" in kwargs:
+            # Encode the body once with orjson; retries resend the same bytes
+            kwargs["data"] = orjson.dumps(kwargs.pop("json"))
+            kwargs.setdefault("headers", JSON_HEADERS)
+        
+        url = f"{self.base_url}{endpoint}"
+        try:
+            return self._make_request_with_retry(method, url, **kwargs)
+        finally:
+            # Even a failed or timed-out write may have reached the server
+            with self._get_cache_lock:
+                self._write_generation += 1
+                self._get_cache.clear()
+    
     def get(self, endpoint: str, **kwargs) -> requests.Response:
-        """Make GET request."""
+        """Make GET request, serving recent identical requests from cache."""
+        params = kwargs.get("params") or {}
+        key = (endpoint, tuple(sorted(params.items())))
+        now = time.monotonic()
+        
+        with self._get_cache_lock:
+            cached = self._get_cache.get(key)
+            generation = self._write_generation
+        if cached and cached[0] > now:
+            logger.debug("Serving GET %s from cache", endpoint)
+            return cached[1]
+        
         url = f"{self.base_url}{endpoint}"
-        return self._make_request_with_retry("GET", url, **kwargs)
+        response = self._make_request_with_retry("GET", url, **kwargs)
+        
+        if response.status_code == 200:
+            with self._get_cache_lock:
+                if self._write_generation != generation:
+                    # A write landed meanwhile, so this response may be stale
+                    return response
+                if len(self._get_cache) >= GET_CACHE_MAX_SIZE:
+                    # Evict the oldest entry
+                    self._get_cache.pop(next(iter(self._get_cache)))
+                self._get_cache[key] = (now + GET_CACHE_TTL, response)
+        
+        return response
     
     def post(self, endpoint: str, **kwargs) -> requests.Response:
         """Make POST request."""
-        url = f"{self.base_url}{endpoint}"
-        return self._make_request_with_retry("POST", url, **kwargs)
+        return self._make_write_request("POST", endpoint, **kwargs)
     
     def put(self, endpoint: str, **kwargs) -> requests.Response:
         """Make PUT request."""
-        url = f"{self.base_url}{endpoint}"
-        return self._make_request_with_retry("PUT", url, **kwargs)
+        return self._make_write_request("PUT", endpoint, **kwargs)
     
     def delete(self, endpoint: str, **kwargs) -> requests.Response:
         """Make DELETE request."""
-        url = f"{self.base_url}{endpoint}"
-        return self._make_request_with_retry("DELETE", url, **kwargs)
+        return self._make_write_request("DELETE", endpoint, **kwargs)
 
 class TicketingTools:
     """Tools for performing ticketing operations via API with AI recommendations."""
@@ -168,19 +250,22 @@ class TicketingTools:
                 }
             
             if 200 <= response.status_code < 300:
-                data = response.json()
+                data = orjson.loads(response.content)
                 return {
                     "success": True,
                     "data": data,
                     "status_code": response.status_code
                 }
             
-            # 4xx errors
-            try:
-                error_data = response.json()
-                error_message = error_data.get("detail", f"HTTP {response.status_code}")
-            except:
-                error_message = f"HTTP {response.status_code}"
+            # 4xx errors; only a JSON body can carry a "detail" message
+            error_message = f"HTTP {response.status_code}"
+            content_type = response.headers.get("content-type", "")
+            if response.content and content_type.startswith("application/json"):
+                try:
+                    error_data = orjson.loads(response.content)
+                    error_message = error_data.get("detail", error_message)
+                except (orjson.JSONDecodeError, AttributeError):
+                    pass
             
             return {
                 "success": False,
@@ -190,64 +275,96 @@ class TicketingTools:
             }
             
         except Exception as e:
-            logger.error(f"Error handling response: {e}")
+            logger.error("Error handling response: %s", e)
             return {
                 "success": False,
                 "message": f"Error processing response: {str(e)}",
                 "retryable": False
             }
     
-    def create_ticket(self, title: str, description: str, comments: Optional[List[str]] = None) -> Dict[str, Any]:
+    def _invoke(self, method: str, endpoint: str, *, op_name: str, error_prefix: str,
+                on_success: Callable[[Any], Dict[str, Any]],
+                failure_prefix: Optional[str] = None,
+                body: Optional[Dict[str, Any]] = None,
+                params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
-        Create a new support ticket.
+        Call the API and build the standardized tool result.
         
         Args:
-            title: Short title for the ticket
-            description: Detailed description of the issue
-            comments: Optional list of initial comments
+            method: HTTP method (GET, POST, PUT or DELETE)
+            endpoint: API endpoint path
+            op_name: Description of the operation, used in logs and server errors
+            error_prefix: Message prefix when the request raises
+            on_success: Builds the message and data fields from the response data
+            failure_prefix: Optional message prefix for API error responses
+            body: Optional JSON body
+            params: Optional query parameters
             
         Returns:
-            Dictionary containing ticket details or error information
+            Dictionary containing the result or error information
         """
+        kwargs: Dict[str, Any] = {}
+        if body is not None:
+            kwargs["json"] = body
+        if params is not None:
+            kwargs["params"] = params
+        
         try:
-            payload = {
-                "title": title,
-                "description": description,
-                "comments": comments or []
-            }
-            
-            logger.info(f"Creating ticket: {title}")
-            response = self.api_client.post(
-                "/tickets",
-                json=payload,
-                headers={"Content-Type": "application/json"}
-            )
-            
-            result = self._handle_response(response, "ticket creation")
+            request = getattr(self.api_client, method.lower())
+            response = request(endpoint, **kwargs)
+            result = self._handle_response(response, op_name)
             
             if result["success"]:
-                ticket = result["data"]
-                logger.info(f"Successfully created ticket: {ticket['id']}")
-                return {
-                    "success": True,
-                    "message": f"Successfully created ticket '{ticket['id']}'",
-                    "ticket": ticket
-                }
-            else:
-                logger.warning(f"Failed to create ticket: {result['message']}")
-                return {
-                    "success": False,
-                    "message": f"Failed to create ticket: {result['message']}",
-                    "status_code": result.get("status_code")
-                }
-                
+                fields = on_success(result["data"])
+                logger.info("Completed %s", op_name)
+                return {"success": True, **fields}
+            
+            logger.warning("Failed %s: %s", op_name, result["message"])
+            message = result["message"]
+            if failure_prefix:
+                message = f"{failure_prefix}: {message}"
+            return {
+                "success": False,
+                "message": message,
+                "status_code": result.get("status_code")
+            }
+            
         except Exception as e:
-            logger.error(f"Exception creating ticket: {e}")
+            logger.error("Exception during %s: %s", op_name, e)
             return {
                 "success": False,
-                "message": f"Error creating ticket: {str(e)}"
+                "message": f"{error_prefix}: {str(e)}"
             }
     
+    def create_ticket(self, title: str, description: str, comments: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Create a new support ticket.
+        
+        Args:
+            title: Short title for the ticket
+            description: Detailed description of the issue
+            comments: Optional list of initial comments
+            
+        Returns:
+            Dictionary containing ticket details or error information
+        """
+        logger.info("Creating ticket: %s", title)
+        payload = {
+            "title": title,
+            "description": description,
+            "comments": comments or []
+        }
+        return self._invoke(
+            "POST", "/tickets", body=payload,
+            op_name="ticket creation",
+            on_success=lambda ticket: {
+                "message": f"Successfully created ticket '{ticket['id']}'",
+                "ticket": ticket
+            },
+            failure_prefix="Failed to create ticket",
+            error_prefix="Error creating ticket"
+        )
+    
     def create_ticket_with_recommendations(self, title: str, description: str, 
                                          comments: Optional[List[str]] = None,
                                          get_recommendations: bool = True) -> Dict[str, Any]:
@@ -263,49 +380,24 @@ class TicketingTools:
         Returns:
             Dictionary containing ticket details and recommendations
         """
-        try:
-            payload = {
-                "title": title,
-                "description": description,
-                "comments": comments or [],
-                "get_recommendations": get_recommendations
-            }
-            
-            logger.info(f"Creating ticket with recommendations: {title}")
-            response = self.api_client.post(
-                "/tickets/with-recommendations",
-                json=payload,
-                headers={"Content-Type": "application/json"}
-            )
-            
-            result = self._handle_response(response, "ticket creation with recommendations")
-            
-            if result["success"]:
-                data = result["data"]
-                ticket = data["ticket"]
-                recommendations = data["recommendations"]
-                
-                logger.info(f"Successfully created ticket with recommendations: {ticket['id']}")
-                return {
-                    "success": True,
-                    "message": f"Successfully created ticket '{ticket['id']}' with AI recommendations",
-                    "ticket": ticket,
-                    "recommendations": recommendations
-                }
-            else:
-                logger.warning(f"Failed to create ticket: {result['message']}")
-                return {
-                    "success": False,
-                    "message": f"Failed to create ticket: {result['message']}",
-                    "status_code": result.get("status_code")
-                }
-                
-        except Exception as e:
-            logger.error(f"Exception creating ticket with recommendations: {e}")
-            return {
-                "success": False,
-                "message": f"Error creating ticket: {str(e)}"
-            }
+        logger.info("Creating ticket with recommendations: %s", title)
+        payload = {
+            "title": title,
+            "description": description,
+            "comments": comments or [],
+            "get_recommendations": get_recommendations
+        }
+        return self._invoke(
+            "POST", "/tickets/with-recommendations", body=payload,
+            op_name="ticket creation with recommendations",
+            on_success=lambda data: {
+                "message": f"Successfully created ticket '{data['ticket']['id']}' with AI recommendations",
+                "ticket": data["ticket"],
+                "recommendations": data["recommendations"]
+            },
+            failure_prefix="Failed to create ticket",
+            error_prefix="Error creating ticket"
+        )
     
     def get_recommendations(self, title: str, description: str, 
                           max_similar: int = 5, max_solutions: int = 3) -> Dict[str, Any]:
@@ -321,45 +413,23 @@ class TicketingTools:
         Returns:
             Dictionary containing recommendations
         """
-        try:
-            payload = {
-                "title": title,
-                "description": description,
-                "max_similar": max_similar,
-                "max_solutions": max_solutions
-            }
-            
-            logger.info(f"Getting recommendations for: {title}")
-            response = self.api_client.post(
-                "/recommendations",
-                json=payload,
-                headers={"Content-Type": "application/json"}
-            )
-            
-            result = self._handle_response(response, "recommendation request")
-            
-            if result["success"]:
-                recommendations = result["data"]
-                logger.info("Successfully retrieved recommendations")
-                return {
-                    "success": True,
-                    "message": "Successfully retrieved recommendations",
-                    "recommendations": recommendations
-                }
-            else:
-                logger.warning(f"Failed to get recommendations: {result['message']}")
-                return {
-                    "success": False,
-                    "message": f"Failed to get recommendations: {result['message']}",
-                    "status_code": result.get("status_code")
-                }
-                
-        except Exception as e:
-            logger.error(f"Exception getting recommendations: {e}")
-            return {
-                "success": False,
-                "message": f"Error getting recommendations: {str(e)}"
-            }
+        logger.info("Getting recommendations for: %s", title)
+        payload = {
+            "title": title,
+            "description": description,
+            "max_similar": max_similar,
+            "max_solutions": max_solutions
+        }
+        return self._invoke(
+            "POST", "/recommendations", body=payload,
+            op_name="recommendation request",
+            on_success=lambda recommendations: {
+                "message": "Successfully retrieved recommendations",
+                "recommendations": recommendations
+            },
+            failure_prefix="Failed to get recommendations",
+            error_prefix="Error getting recommendations"
+        )
     
     def get_trending_issues(self, days: int = 7) -> Dict[str, Any]:
         """
@@ -371,34 +441,17 @@ class TicketingTools:
         Returns:
             Dictionary containing trending issues
         """
-        try:
-            logger.info(f"Getting trending issues for last {days} days")
-            response = self.api_client.get(f"/analytics/trending?days={days}")
-            
-            result = self._handle_response(response, "trending issues request")
-            
-            if result["success"]:
-                trending_data = result["data"]
-                logger.info("Successfully retrieved trending issues")
-                return {
-                    "success": True,
-                    "message": f"Retrieved trending issues for last {days} days",
-                    "trending_data": trending_data
-                }
-            else:
-                logger.warning(f"Failed to get trending issues: {result['message']}")
-                return {
-                    "success": False,
-                    "message": f"Failed to get trending issues: {result['message']}",
-                    "status_code": result.get("status_code")
-                }
-                
-        except Exception as e:
-            logger.error(f"Exception getting trending issues: {e}")
-            return {
-                "success": False,
-                "message": f"Error getting trending issues: {str(e)}"
-            }
+        logger.info("Getting trending issues for last %s days", days)
+        return self._invoke(
+            "GET", f"/analytics/trending?days={days}",
+            op_name="trending issues request",
+            on_success=lambda trending_data: {
+                "message": f"Retrieved trending issues for last {days} days",
+                "trending_data": trending_data
+            },
+            failure_prefix="Failed to get trending issues",
+            error_prefix="Error getting trending issues"
+        )
     
     def get_category_stats(self) -> Dict[str, Any]:
         """
@@ -407,34 +460,17 @@ class TicketingTools:
         Returns:
             Dictionary containing category statistics
         """
-        try:
-            logger.info("Getting category statistics")
-            response = self.api_client.get("/analytics/categories")
-            
-            result = self._handle_response(response, "category statistics request")
-            
-            if result["success"]:
-                stats_data = result["data"]
-                logger.info("Successfully retrieved category statistics")
-                return {
-                    "success": True,
-                    "message": "Retrieved category statistics",
-                    "stats": stats_data
-                }
-            else:
-                logger.warning(f"Failed to get category stats: {result['message']}")
-                return {
-                    "success": False,
-                    "message": f"Failed to get category stats: {result['message']}",
-                    "status_code": result.get("status_code")
-                }
-                
-        except Exception as e:
-            logger.error(f"Exception getting category stats: {e}")
-            return {
-                "success": False,
-                "message": f"Error getting category stats: {str(e)}"
-            }
+        logger.info("Getting category statistics")
+        return self._invoke(
+            "GET", "/analytics/categories",
+            op_name="category statistics request",
+            on_success=lambda stats_data: {
+                "message": "Retrieved category statistics",
+                "stats": stats_data
+            },
+            failure_prefix="Failed to get category stats",
+            error_prefix="Error getting category stats"
+        )
     
     def get_tickets(self, status_filter: Optional[str] = None, category_filter: Optional[str] = None, 
                    priority_filter: Optional[str] = None) -> Dict[str, Any]:
@@ -449,46 +485,30 @@ class TicketingTools:
         Returns:
             Dictionary containing list of tickets or error information
         """
-        try:
-            params = {}
-            if status_filter:
-                params["status"] = status_filter.upper()
-                logger.info(f"Retrieving tickets with status: {status_filter}")
-            if category_filter:
-                params["category"] = category_filter.upper()
-                logger.info(f"Retrieving tickets with category: {category_filter}")
-            if priority_filter:
-                params["priority"] = priority_filter.upper()
-                logger.info(f"Retrieving tickets with priority: {priority_filter}")
-            
-            if not params:
-                logger.info("Retrieving all tickets")
-            
-            response = self.api_client.get("/tickets", params=params)
-            result = self._handle_response(response, "ticket retrieval")
-            
-            if result["success"]:
-                tickets = result["data"]
-                logger.info(f"Successfully retrieved {len(tickets)} tickets")
-                return {
-                    "success": True,
-                    "message": f"Found {len(tickets)} tickets",
-                    "tickets": tickets
-                }
-            else:
-                logger.warning(f"Failed to retrieve tickets: {result['message']}")
-                return {
-                    "success": False,
-                    "message": f"Failed to retrieve tickets: {result['message']}",
-                    "status_code": result.get("status_code")
-                }
-                
-        except Exception as e:
-            logger.error(f"Exception retrieving tickets: {e}")
-            return {
-                "success": False,
-                "message": f"Error retrieving tickets: {str(e)}"
-            }
+        params = {}
+        if status_filter:
+            params["status"] = status_filter.upper()
+            logger.info("Retrieving tickets with status: %s", status_filter)
+        if category_filter:
+            params["category"] = category_filter.upper()
+            logger.info("Retrieving tickets with category: %s", category_filter)
+        if priority_filter:
+            params["priority"] = priority_filter.upper()
+            logger.info("Retrieving tickets with priority: %s", priority_filter)
+        
+        if not params:
+            logger.info("Retrieving all tickets")
+        
+        return self._invoke(
+            "GET", "/tickets", params=params,
+            op_name="ticket retrieval",
+            on_success=lambda tickets: {
+                "message": f"Found {len(tickets)} tickets",
+                "tickets": tickets
+            },
+            failure_prefix="Failed to retrieve tickets",
+            error_prefix="Error retrieving tickets"
+        )
     
     def get_ticket_by_id(self, ticket_id: str) -> Dict[str, Any]:
         """
@@ -500,33 +520,16 @@ class TicketingTools:
         Returns:
             Dictionary containing ticket details or error information
         """
-        try:
-            logger.info(f"Retrieving ticket: {ticket_id}")
-            response = self.api_client.get(f"/tickets/{ticket_id}")
-            result = self._handle_response(response, f"ticket {ticket_id} retrieval")
-            
-            if result["success"]:
-                ticket = result["data"]
-                logger.info(f"Successfully retrieved ticket: {ticket_id}")
-                return {
-                    "success": True,
-                    "message": f"Retrieved ticket '{ticket_id}'",
-                    "ticket": ticket
-                }
-            else:
-                logger.warning(f"Failed to retrieve ticket {ticket_id}: {result['message']}")
-                return {
-                    "success": False,
-                    "message": result["message"],
-                    "status_code": result.get("status_code")
-                }
-                
-        except Exception as e:
-            logger.error(f"Exception retrieving ticket {ticket_id}: {e}")
-            return {
-                "success": False,
-                "message": f"Error retrieving ticket: {str(e)}"
-            }
+        logger.info("Retrieving ticket: %s", ticket_id)
+        return self._invoke(
+            "GET", f"/tickets/{ticket_id}",
+            op_name=f"ticket {ticket_id} retrieval",
+            on_success=lambda ticket: {
+                "message": f"Retrieved ticket '{ticket_id}'",
+                "ticket": ticket
+            },
+            error_prefix="Error retrieving ticket"
+        )
     
     def update_ticket(self, ticket_id: str, title: Optional[str] = None, 
                      description: Optional[str] = None, status: Optional[str] = None,
@@ -550,56 +553,34 @@ class TicketingTools:
         Returns:
             Dictionary containing updated ticket details or error information
         """
-        try:
-            payload = {}
-            if title is not None:
-                payload["title"] = title
-            if description is not None:
-                payload["description"] = description
-            if status is not None:
-                payload["status"] = status.upper()
-            if resolution is not None:
-                payload["resolution"] = resolution
-            if comments is not None:
-                payload["comments"] = comments
-            if category is not None:
-                payload["category"] = category.upper()
-            if priority is not None:
-                payload["priority"] = priority.upper()
-            if tags is not None:
-                payload["tags"] = tags
-            
-            logger.info(f"Updating ticket: {ticket_id}")
-            response = self.api_client.put(
-                f"/tickets/{ticket_id}",
-                json=payload,
-                headers={"Content-Type": "application/json"}
-            )
-            
-            result = self._handle_response(response, f"ticket {ticket_id} update")
-            
-            if result["success"]:
-                ticket = result["data"]
-                logger.info(f"Successfully updated ticket: {ticket_id}")
-                return {
-                    "success": True,
-                    "message": f"Successfully updated ticket '{ticket_id}'",
-                    "ticket": ticket
-                }
-            else:
-                logger.warning(f"Failed to update ticket {ticket_id}: {result['message']}")
-                return {
-                    "success": False,
-                    "message": result["message"],
-                    "status_code": result.get("status_code")
-                }
-                
-        except Exception as e:
-            logger.error(f"Exception updating ticket {ticket_id}: {e}")
-            return {
-                "success": False,
-                "message": f"Error updating ticket: {str(e)}"
-            }
+        payload = {}
+        if title is not None:
+            payload["title"] = title
+        if description is not None:
+            payload["description"] = description
+        if status is not None:
+            payload["status"] = status.upper()
+        if resolution is not None:
+            payload["resolution"] = resolution
+        if comments is not None:
+            payload["comments"] = comments
+        if category is not None:
+            payload["category"] = category.upper()
+        if priority is not None:
+            payload["priority"] = priority.upper()
+        if tags is not None:
+            payload["tags"] = tags
+        
+        logger.info("Updating ticket: %s", ticket_id)
+        return self._invoke(
+            "PUT", f"/tickets/{ticket_id}", body=payload,
+            op_name=f"ticket {ticket_id} update",
+            on_success=lambda ticket: {
+                "message": f"Successfully updated ticket '{ticket_id}'",
+                "ticket": ticket
+            },
+            error_prefix="Error updating ticket"
+        )
     
     def delete_ticket(self, ticket_id: str) -> Dict[str, Any]:
         """
@@ -611,31 +592,15 @@ class TicketingTools:
         Returns:
             Dictionary containing success/error information
         """
-        try:
-            logger.info(f"Deleting ticket: {ticket_id}")
-            response = self.api_client.delete(f"/tickets/{ticket_id}")
-            result = self._handle_response(response, f"ticket {ticket_id} deletion")
-            
-            if result["success"]:
-                logger.info(f"Successfully deleted ticket: {ticket_id}")
-                return {
-                    "success": True,
-                    "message": f"Successfully deleted ticket '{ticket_id}'"
-                }
-            else:
-                logger.warning(f"Failed to delete ticket {ticket_id}: {result['message']}")
-                return {
-                    "success": False,
-                    "message": result["message"],
-                    "status_code": result.get("status_code")
-                }
-                
-        except Exception as e:
-            logger.error(f"Exception deleting ticket {ticket_id}: {e}")
-            return {
-                "success": False,
-                "message": f"Error deleting ticket: {str(e)}"
-            }
+        logger.info("Deleting ticket: %s", ticket_id)
+        return self._invoke(
+            "DELETE", f"/tickets/{ticket_id}",
+            op_name=f"ticket {ticket_id} deletion",
+            on_success=lambda _: {
+                "message": f"Successfully deleted ticket '{ticket_id}'"
+            },
+            error_prefix="Error deleting ticket"
+        )
 
     def search_similar_tickets(self, title: str, description: str) -> Dict[str, Any]:
         """
@@ -648,5 +613,5 @@ class TicketingTools:
         Returns:
             Dictionary containing similar tickets and solutions
         """
-        logger.info(f"Searching for similar tickets: {title}")
+        logger.info("Searching for similar tickets: %s", title)
         return self.get_recommendations(title, description, max_similar=10, max_solutions=5)
@@ -13,8 +13,17 @@ class TicketDatabase:
     """Thread-safe in-memory ticket database."""
     
     def __init__(self):
+        # Tickets are stamped with their creation time as they are inserted and
+        # updates replace values in place, so insertion order is creation order
         self._tickets: Dict[str, Ticket] = {}
         self._lock = threading.RLock()
+        # Bumped on every write so readers can tell whether anything changed
+        self._version = 0
+    
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever the stored tickets change."""
+        return self._version
     
     def initialize_sample_data(self) -> None:
         """Initialize database with sample tickets."""
@@ -52,16 +61,18 @@ class TicketDatabase:
             for ticket_data in sample_tickets:
                 ticket = Ticket(**ticket_data)
                 self._tickets[ticket.id] = ticket
+            self._version += 1
     
     def get_all_tickets(self, status_filter: Optional[TicketStatus] = None) -> List[Ticket]:
         """Get all tickets, optionally filtered by status."""
         with self._lock:
-            tickets = list(self._tickets.values())
+            # Newest first, without re-sorting on every listing
+            tickets = reversed(self._tickets.values())
             
             if status_filter:
-                tickets = [t for t in tickets if t.status == status_filter]
+                return [t for t in tickets if t.status == status_filter]
                 
-            return sorted(tickets, key=lambda x: x.created, reverse=True)
+            return list(tickets)
     
     def get_ticket_by_id(self, ticket_id: str) -> Optional[Ticket]:
         """Get a ticket by ID."""
@@ -72,6 +83,7 @@ class TicketDatabase:
         """Create a new ticket."""
         with self._lock:
             self._tickets[ticket.id] = ticket
+            self._version += 1
             return ticket
     
     def update_ticket(self, ticket_id: str, ticket: Ticket) -> Optional[Ticket]:
@@ -80,6 +92,7 @@ class TicketDatabase:
             if ticket_id in self._tickets:
                 ticket.updated = datetime.now()
                 self._tickets[ticket_id] = ticket
+                self._version += 1
                 return ticket
             return None
     
@@ -88,6 +101,7 @@ class TicketDatabase:
         with self._lock:
             if ticket_id in self._tickets:
                 del self._tickets[ticket_id]
+                self._version += 1
                 return True
             return False
     
@@ -100,6 +114,7 @@ class TicketDatabase:
         """Clear all tickets (for testing)."""
         with self._lock:
             self._tickets.clear()
+            self._version += 1
 
 
 # Global database instance
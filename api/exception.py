@@ -15,16 +15,6 @@ class TicketNotFoundError(HTTPException):
         )
 
 
-class InvalidStatusError(HTTPException):
-    """Raised when an invalid status is provided."""
-    def __init__(self, status: str, valid_statuses: list):
-        valid_status_str = ", ".join(valid_statuses)
-        super().__init__(
-            status_code=422,
-            detail=f"Invalid status '{status}'. Valid statuses are: {valid_status_str}"
-        )
-
-
 class ValidationError(HTTPException):
     """Raised for validation errors."""
     def __init__(self, message: str):
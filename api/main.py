@@ -6,6 +6,8 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 import uvicorn
 
 from config.settings import api_settings
@@ -26,13 +28,17 @@ async def lifespan(app: FastAPI):
 
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
+    # Interactive docs and the OpenAPI schema are only served in debug mode
+    docs_enabled = api_settings.debug
     app = FastAPI(
         title=api_settings.title,
         description=api_settings.description,
         version=api_settings.version,
         lifespan=lifespan,
-        docs_url="/docs",
-        redoc_url="/redoc"
+        default_response_class=ORJSONResponse,
+        docs_url="/docs" if docs_enabled else None,
+        redoc_url="/redoc" if docs_enabled else None,
+        openapi_url="/openapi.json" if docs_enabled else None,
     )
     
     # Add CORS middleware
@@ -44,8 +50,21 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
     
-    # Add network simulation middleware
-    app.add_middleware(NetworkSimulationMiddleware)
+    # Compress ticket listings; level 1 keeps the CPU cost per response low
+    app.add_middleware(
+        GZipMiddleware,
+        minimum_size=api_settings.gzip_minimum_size,
+        compresslevel=1,
+    )
+    
+    # Add network simulation middleware (skipped entirely when disabled)
+    if api_settings.simulate_network:
+        app.add_middleware(
+            NetworkSimulationMiddleware,
+            min_latency=api_settings.min_latency,
+            max_latency=api_settings.max_latency,
+            failure_rate=api_settings.failure_rate,
+        )
     
     # Include routes
     app.include_router(router, prefix="", tags=["tickets"])
@@ -63,7 +82,8 @@ def main():
         "api.main:app",
         host=api_settings.host,
         port=api_settings.port,
-        reload=api_settings.debug
+        reload=api_settings.debug,
+        access_log=api_settings.access_log
     )
 
 
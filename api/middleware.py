@@ -4,31 +4,59 @@ Middleware for simulating network conditions.
 """
 import asyncio
 import random
-from typing import Callable, Awaitable
+from typing import FrozenSet, Tuple
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi.responses import ORJSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
-from config.settings import api_settings
 from .exception import SimulatedServerError
 
+# Health checks and docs are never delayed or failed
+SKIP_PATHS: FrozenSet[str] = frozenset({"/health", "/docs", "/openapi.json", "/redoc"})
 
-class NetworkSimulationMiddleware(BaseHTTPMiddleware):
+
+def _simulated_error_response(status_code: int) -> ORJSONResponse:
+    """Build the response for a simulated server error."""
+    error = SimulatedServerError(status_code)
+    return ORJSONResponse({"detail": error.detail}, status_code=error.status_code)
+
+
+# The failure responses never change, so they are built once and resent
+SIMULATED_ERRORS: Tuple[ORJSONResponse, ...] = tuple(
+    _simulated_error_response(status_code) for status_code in (500, 503)
+)
+
+
+class NetworkSimulationMiddleware:
     """Middleware to simulate network latency and failures."""
-    
-    async def dispatch(self, request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
-        # Skip simulation for health checks and docs
-        if request.url.path in ["/health", "/docs", "/openapi.json", "/redoc"]:
-            return await call_next(request)
-        
+
+    def __init__(self, app: ASGIApp, min_latency: float, max_latency: float, failure_rate: float):
+        self.app = app
+        self.min_latency = min_latency
+        self.max_latency = max_latency
+        self.failure_rate = failure_rate
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Plain ASGI rather than BaseHTTPMiddleware, so requests are not
+        # wrapped in an extra task and stream on every call
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if scope["path"] in SKIP_PATHS:
+            await self.app(scope, receive, send)
+            return
+
         # Simulate network latency
-        delay = random.uniform(api_settings.min_latency, api_settings.max_latency)
+        delay = random.uniform(self.min_latency, self.max_latency)
         await asyncio.sleep(delay)
-        
-        # Simulate intermittent failures
-        if random.random() < api_settings.failure_rate:
-            error_type = random.choice([500, 503])
-            raise SimulatedServerError(error_type)
-        
+
+        # Simulate intermittent failures by sending the error response
+        # directly; raising here would bypass FastAPI's handlers
+        if random.random() < self.failure_rate:
+            response = random.choice(SIMULATED_ERRORS)
+            await response(scope, receive, send)
+            return
+
         # Process the request normally
-        return await call_next(request)
+        await self.app(scope, receive, send)
@@ -5,9 +5,8 @@ Pydantic models for the ticketing API.
 from datetime import datetime
 from enum import Enum
 from typing import List, Optional
-from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, ValidationInfo, field_validator
 
 
 class TicketStatus(str, Enum):
@@ -37,10 +36,11 @@ class TicketUpdate(BaseModel):
     resolution: Optional[str] = Field(None, max_length=500)
     comments: Optional[List[str]] = None
     
-    @validator('resolution')
-    def validate_resolution(cls, v, values):
+    @field_validator("resolution")
+    @classmethod
+    def validate_resolution(cls, v: Optional[str], info: ValidationInfo) -> Optional[str]:
         """Validate resolution field based on status."""
-        status = values.get('status')
+        status = info.data.get("status")
         if status == TicketStatus.RESOLVED and not v:
             raise ValueError("Resolution is required when status is RESOLVED")
         return v
@@ -53,11 +53,6 @@ class Ticket(TicketBase):
     updated: Optional[datetime] = Field(None, description="Last update timestamp")
     status: TicketStatus = Field(default=TicketStatus.OPEN, description="Current ticket status")
     resolution: Optional[str] = Field(None, max_length=500, description="Resolution notes")
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
 
 
 class ErrorResponse(BaseModel):
@@ -65,19 +60,9 @@ class ErrorResponse(BaseModel):
     detail: str = Field(..., description="Error description")
     error_code: Optional[str] = Field(None, description="Error code")
     timestamp: datetime = Field(default_factory=datetime.now, description="Error timestamp")
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
 
 
 class SuccessResponse(BaseModel):
     """Standard success response model."""
     message: str = Field(..., description="Success message")
-    timestamp: datetime = Field(default_factory=datetime.now, description="Response timestamp")
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
\ No newline at end of file
+    timestamp: datetime = Field(default_factory=datetime.now, description="Response timestamp")
\ No newline at end of file
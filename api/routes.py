@@ -2,15 +2,17 @@
 """
 API route definitions.
 """
+import secrets
+import time
 from datetime import datetime
-from typing import List, Optional
-from uuid import uuid4
+from typing import List, Optional, Union
 
-from fastapi import APIRouter, Query, HTTPException
+from fastapi import APIRouter, Query, HTTPException, Request, Response
 from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter, ValidationError as PydanticValidationError
 
 from .database import ticket_db
-from .exception import TicketNotFoundError, InvalidStatusError, ValidationError
+from .exception import TicketNotFoundError, ValidationError
 from .models import (
     Ticket, 
     TicketCreate, 
@@ -22,35 +24,94 @@ from .models import (
 
 router = APIRouter()
 
+# Tickets held in the database are already validated, so the endpoints
+# serialize them directly instead of letting FastAPI re-validate them
+# against ``response_model`` on every request.
+_ticket_list_adapter = TypeAdapter(List[Ticket])
+
+# The ticket version restarts when the process does, so ETags also carry a
+# per-process epoch; tags from an earlier run never match
+ETAG_EPOCH = secrets.token_hex(4)
+
+# /health is polled often and its timestamp only needs ~100ms resolution
+HEALTH_TIMESTAMP_TTL = 0.1
+_health_timestamp = (0.0, "")
+
+
+def _json_response(content: Union[bytes, str], etag: Optional[str] = None,
+                   status_code: int = 200) -> Response:
+    """Wrap pre-serialized JSON in a response."""
+    headers = {"ETag": etag, "Cache-Control": "no-cache"} if etag else None
+    return Response(content=content, status_code=status_code,
+                    media_type="application/json", headers=headers)
+
+
+def _cached_now_iso() -> str:
+    """Return the current time in ISO format, refreshed every HEALTH_TIMESTAMP_TTL."""
+    global _health_timestamp
+    now = time.monotonic()
+    expires, value = _health_timestamp
+    if now >= expires:
+        value = datetime.now().isoformat()
+        _health_timestamp = (now + HEALTH_TIMESTAMP_TTL, value)
+    return value
+
+
+def _not_modified(request: Request, etag: str) -> Optional[Response]:
+    """Return an empty 304 response if the client already holds ``etag``."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return None
+    
+    tags = {tag.strip() for tag in if_none_match.split(",")}
+    if etag in tags or "*" in tags:
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+    return None
+
 
 @router.get("/tickets", response_model=List[Ticket], summary="Get all tickets")
 async def get_tickets(
+    request: Request,
     status: Optional[TicketStatus] = Query(None, description="Filter by ticket status")
-) -> List[Ticket]:
+) -> Response:
     """
     Retrieve all tickets, optionally filtered by status.
     
     - **status**: Optional status filter (OPEN, RESOLVED, CLOSED)
     """
-    return ticket_db.get_all_tickets(status_filter=status)
+    # The database version identifies the listing, so a matching
+    # If-None-Match is answered without reading or serializing tickets
+    etag = f'W/"{ETAG_EPOCH}-{ticket_db.version}-{status.value if status else "all"}"'
+    not_modified = _not_modified(request, etag)
+    if not_modified:
+        return not_modified
+    
+    tickets = ticket_db.get_all_tickets(status_filter=status)
+    return _json_response(_ticket_list_adapter.dump_json(tickets), etag)
 
 
 @router.get("/tickets/{ticket_id}", response_model=Ticket, summary="Get ticket by ID")
-async def get_ticket(ticket_id: str) -> Ticket:
+async def get_ticket(request: Request, ticket_id: str) -> Response:
     """
     Retrieve a specific ticket by ID.
     
     - **ticket_id**: The unique identifier of the ticket
     """
+    # Read the version first so the tag is never newer than the ticket sent
+    etag = f'W/"{ETAG_EPOCH}-{ticket_db.version}"'
     ticket = ticket_db.get_ticket_by_id(ticket_id)
     if not ticket:
         raise TicketNotFoundError(ticket_id)
     
-    return ticket
+    not_modified = _not_modified(request, etag)
+    if not_modified:
+        return not_modified
+    
+    return _json_response(ticket.model_dump_json(), etag)
 
 
 @router.post("/tickets", response_model=Ticket, status_code=201, summary="Create a new ticket")
-async def create_ticket(ticket_data: TicketCreate) -> Ticket:
+async def create_ticket(ticket_data: TicketCreate) -> Response:
     """
     Create a new support ticket.
     
@@ -58,22 +119,25 @@ async def create_ticket(ticket_data: TicketCreate) -> Ticket:
     - **description**: Detailed description of the issue (1-1000 characters)  
     - **comments**: Optional list of initial comments
     """
-    ticket_id = f"ticket-{uuid4().hex[:8]}"
+    # Eight random hex characters, regenerated on the rare collision
+    ticket_id = f"ticket-{secrets.token_hex(4)}"
+    while ticket_db.ticket_exists(ticket_id):
+        ticket_id = f"ticket-{secrets.token_hex(4)}"
     
     new_ticket = Ticket(
         id=ticket_id,
         title=ticket_data.title,
         description=ticket_data.description,
         comments=ticket_data.comments or [],
-        created=datetime.now(),
         status=TicketStatus.OPEN
     )
     
-    return ticket_db.create_ticket(new_ticket)
+    ticket_db.create_ticket(new_ticket)
+    return _json_response(new_ticket.model_dump_json(), status_code=201)
 
 
 @router.put("/tickets/{ticket_id}", response_model=Ticket, summary="Update a ticket")
-async def update_ticket(ticket_id: str, ticket_update: TicketUpdate) -> Ticket:
+async def update_ticket(ticket_id: str, ticket_update: TicketUpdate) -> Response:
     """
     Update an existing ticket.
     
@@ -88,35 +152,35 @@ async def update_ticket(ticket_id: str, ticket_update: TicketUpdate) -> Ticket:
     if not existing_ticket:
         raise TicketNotFoundError(ticket_id)
     
-    # Validate status if provided
-    if ticket_update.status:
-        try:
-            TicketStatus(ticket_update.status)
-        except ValueError:
-            valid_statuses = [status.value for status in TicketStatus]
-            raise InvalidStatusError(ticket_update.status, valid_statuses)
-        
-        # Check resolution requirement for RESOLVED status
-        if (ticket_update.status == TicketStatus.RESOLVED and 
-            not ticket_update.resolution and 
-            not existing_ticket.resolution):
-            raise ValidationError(
-                "Resolution note is required when setting ticket status to 'RESOLVED'. Please provide a resolution."
-            )
-    
-    # Apply updates
-    update_data = ticket_update.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(existing_ticket, field, value)
-    
-    existing_ticket.updated = datetime.now()
-    
-    updated_ticket = ticket_db.update_ticket(ticket_id, existing_ticket)
-    return updated_ticket
+    # TicketUpdate.status is typed as TicketStatus, so pydantic has already
+    # rejected unknown values; only the resolution requirement is left
+    if (ticket_update.status == TicketStatus.RESOLVED and 
+        not ticket_update.resolution and 
+        not existing_ticket.resolution):
+        raise ValidationError(
+            "Resolution note is required when setting ticket status to 'RESOLVED'. Please provide a resolution."
+        )
+    
+    # Validate the merged ticket: TicketUpdate allows explicit nulls that
+    # the ticket's required fields do not
+    update_data = ticket_update.model_dump(exclude_unset=True)
+    try:
+        updated_ticket = Ticket.model_validate({**existing_ticket.model_dump(), **update_data})
+    except PydanticValidationError as e:
+        errors = "; ".join(
+            f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}" for error in e.errors()
+        )
+        raise ValidationError(f"Invalid ticket update: {errors}")
+    
+    # Persist changes (the database stamps the update time)
+    if not ticket_db.update_ticket(ticket_id, updated_ticket):
+        raise TicketNotFoundError(ticket_id)
+    
+    return _json_response(updated_ticket.model_dump_json())
 
 
 @router.delete("/tickets/{ticket_id}", response_model=SuccessResponse, summary="Delete a ticket")
-async def delete_ticket(ticket_id: str) -> SuccessResponse:
+async def delete_ticket(ticket_id: str) -> Response:
     """
     Delete a ticket permanently.
     
@@ -129,7 +193,8 @@ async def delete_ticket(ticket_id: str) -> SuccessResponse:
     if not success:
         raise HTTPException(status_code=500, detail="Failed to delete ticket")
     
-    return SuccessResponse(message=f"Ticket '{ticket_id}' has been successfully deleted")
+    result = SuccessResponse(message=f"Ticket '{ticket_id}' has been successfully deleted")
+    return _json_response(result.model_dump_json())
 
 
 @router.get("/health", summary="Health check")
@@ -137,6 +202,6 @@ async def health_check():
     """Simple health check endpoint."""
     return {
         "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _cached_now_iso(),
         "version": "1.0.0"
     }
@@ -4,7 +4,8 @@ Application configuration settings.
 """
 import os
 from typing import List, Optional
-from pydantic_settings import BaseSettings
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class APISettings(BaseSettings):
@@ -16,15 +17,18 @@ class APISettings(BaseSettings):
     host: str = "0.0.0.0"
     port: int = 8000
     debug: bool = False
+    access_log: bool = False
+    
+    # Responses at least this large are gzip-compressed
+    gzip_minimum_size: int = 1024
     
     # Simulation settings
+    simulate_network: bool = True
     min_latency: float = 0.25
     max_latency: float = 2.0
     failure_rate: float = 0.25
     
-    class Config:
-        env_file = ".env"
-        env_prefix = "API_"
+    model_config = SettingsConfigDict(env_file=".env", env_prefix="API_")
 
 
 class LLMSettings(BaseSettings):
@@ -36,9 +40,7 @@ class LLMSettings(BaseSettings):
     model: str = "gpt-4o"
     temperature: float = 0.1
     
-    class Config:
-        env_file = ".env"
-        env_prefix = "LLM_"
+    model_config = SettingsConfigDict(env_file=".env", env_prefix="LLM_")
 
 
 class AgentSettings(BaseSettings):
@@ -48,10 +50,12 @@ class AgentSettings(BaseSettings):
     max_retries: int = 3
     base_delay: float = 1.0
     backoff_factor: float = 2.0
+    connect_timeout: float = 3.0
+    read_timeout: float = 10.0
+    # At least one message, so the latest turn always fits the window
+    max_history_messages: int = Field(40, ge=1)
     
-    class Config:
-        env_file = ".env"
-        env_prefix = "AGENT_"
+    model_config = SettingsConfigDict(env_file=".env", env_prefix="AGENT_")
 
 
 # Global settings instances
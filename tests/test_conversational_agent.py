@@ -0,0 +1,133 @@
+"""
+Tests for the conversational agent's history handling.
+"""
+from unittest.mock import Mock
+
+import pytest
+
+from agent.conversational_agent import DIRECT_COMMANDS, TicketingAgent
+from config.settings import agent_settings
+
+
+def _agent(messages):
+    # _trim_history only touches the message list, so skip the LLM/API setup
+    agent = TicketingAgent.__new__(TicketingAgent)
+    agent.system_message = {"role": "system", "content": "system"}
+    agent._messages = [agent.system_message, *messages]
+    return agent
+
+
+def _turn(n, tool_calls=0):
+    messages = [{"role": "user", "content": f"user {n}"}]
+    if tool_calls:
+        messages.append({"role": "assistant", "content": None, "tool_calls": []})
+        messages.extend({"role": "tool", "content": f"tool {n}.{i}"} for i in range(tool_calls))
+    messages.append({"role": "assistant", "content": f"assistant {n}"})
+    return messages
+
+
+@pytest.fixture
+def max_history(monkeypatch):
+    def set_max(value):
+        monkeypatch.setattr(agent_settings, "max_history_messages", value)
+    return set_max
+
+
+def test_history_within_window_is_kept(max_history):
+    max_history(4)
+    messages = _turn(1) + _turn(2)
+    agent = _agent(messages)
+    
+    agent._trim_history()
+    
+    assert agent.conversation_history == messages
+
+
+def test_oldest_turns_are_dropped_at_turn_boundary(max_history):
+    max_history(4)
+    agent = _agent(_turn(1) + _turn(2) + _turn(3))
+    
+    agent._trim_history()
+    
+    assert agent._messages[0] is agent.system_message
+    assert agent.conversation_history == _turn(2) + _turn(3)
+
+
+def test_tool_results_stay_with_their_turn(max_history):
+    max_history(5)
+    agent = _agent(_turn(1) + _turn(2, tool_calls=2) + _turn(3))
+    
+    agent._trim_history()
+    
+    # Keeping exactly five messages would start inside turn 2's tool
+    # results, so the cut moves back to the start of turn 2
+    assert agent.conversation_history == _turn(2, tool_calls=2) + _turn(3)
+
+
+def test_latest_turn_longer_than_window_is_kept(max_history):
+    max_history(2)
+    messages = _turn(1, tool_calls=3)
+    agent = _agent(messages)
+    
+    agent._trim_history()
+    
+    assert agent.conversation_history == messages
+
+
+def test_smallest_window_keeps_latest_turn(max_history):
+    max_history(1)
+    agent = _agent(_turn(1) + _turn(2))
+    
+    agent._trim_history()
+    
+    assert agent.conversation_history == _turn(2)
+
+
+@pytest.mark.parametrize("command", ["get ticket ticket-001", "Get ticket TICKET-001"])
+def test_direct_ticket_command_lowercases_id(command):
+    for pattern, to_call in DIRECT_COMMANDS:
+        match = pattern.fullmatch(command)
+        if match:
+            assert to_call(match) == ("get_ticket_by_id", {"ticket_id": "ticket-001"})
+            return
+    pytest.fail(f"{command!r} did not match a direct command")
+
+
+def _tool_agent(**functions):
+    agent = _agent([])
+    agent._functions = {name: Mock(side_effect=function) for name, function in functions.items()}
+    return agent
+
+
+def test_identical_reads_are_executed_once():
+    agent = _tool_agent(get_ticket_by_id=lambda ticket_id: {"success": True, "id": ticket_id})
+    read = ("get_ticket_by_id", {"ticket_id": "ticket-001"})
+    
+    results = agent._execute_functions([read, read])
+    
+    assert results == [{"success": True, "id": "ticket-001"}] * 2
+    assert agent._functions["get_ticket_by_id"].call_count == 1
+
+
+def test_read_after_write_is_executed_again():
+    ticket = {"title": "Login issues"}
+    
+    def update_ticket(ticket_id, title):
+        ticket["title"] = title
+        return {"success": True}
+    
+    agent = _tool_agent(
+        get_ticket_by_id=lambda ticket_id: {"success": True, "title": ticket["title"]},
+        update_ticket=update_ticket,
+    )
+    read = ("get_ticket_by_id", {"ticket_id": "ticket-001"})
+    
+    results = agent._execute_functions([
+        read,
+        ("update_ticket", {"ticket_id": "ticket-001", "title": "Renamed"}),
+        read,
+    ])
+    
+    assert results[0]["title"] == "Login issues"
+    assert results[2]["title"] == "Renamed"
+    assert agent._functions["get_ticket_by_id"].call_count == 2
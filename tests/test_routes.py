@@ -0,0 +1,55 @@
+"""
+Tests for the ticket API routes.
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+from api.main import create_app
+from config.settings import api_settings
+
+
+@pytest.fixture
+def client(monkeypatch):
+    # Without simulated latency and failures the responses are deterministic
+    monkeypatch.setattr(api_settings, "simulate_network", False)
+    with TestClient(create_app()) as test_client:
+        yield test_client
+
+
+def test_update_with_null_required_field_is_rejected(client):
+    response = client.put("/tickets/ticket-001", json={"title": None})
+    
+    assert response.status_code == 422
+    assert client.get("/tickets/ticket-001").json()["title"] == "Login issues"
+
+
+def test_update_of_missing_ticket_returns_404(client):
+    response = client.put("/tickets/ticket-999", json={"title": "New title"})
+    
+    assert response.status_code == 404
+
+
+def test_if_none_match_on_missing_ticket_returns_404(client):
+    response = client.get("/tickets/ticket-999", headers={"If-None-Match": "*"})
+    
+    assert response.status_code == 404
+
+
+def test_matching_etag_returns_304(client):
+    etag = client.get("/tickets/ticket-001").headers["ETag"]
+    
+    response = client.get("/tickets/ticket-001", headers={"If-None-Match": etag})
+    
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert not response.content
+
+
+def test_etag_changes_after_update(client):
+    etag = client.get("/tickets/ticket-001").headers["ETag"]
+    client.put("/tickets/ticket-001", json={"title": "New title"})
+    
+    response = client.get("/tickets/ticket-001", headers={"If-None-Match": etag})
+    
+    assert response.status_code == 200
+    assert response.json()["title"] == "New title"
@@ -0,0 +1,90 @@
+"""
+Tests for the agent's API client.
+"""
+from unittest.mock import Mock
+
+import pytest
+
+from agent.tools import APIClient, RetryConfig
+
+
+def _response(status_code: int = 200) -> Mock:
+    return Mock(status_code=status_code, content=b"{}")
+
+
+@pytest.fixture
+def client():
+    return APIClient("http://test.com", RetryConfig(max_retries=1, base_delay=0.0))
+
+
+def test_repeated_get_is_served_from_cache(client, monkeypatch):
+    request = Mock(return_value=_response())
+    monkeypatch.setattr(client.session, "request", request)
+    
+    first = client.get("/tickets", params={"status": "OPEN"})
+    second = client.get("/tickets", params={"status": "OPEN"})
+    
+    assert second is first
+    assert request.call_count == 1
+
+
+def test_get_with_different_params_is_not_shared(client, monkeypatch):
+    request = Mock(return_value=_response())
+    monkeypatch.setattr(client.session, "request", request)
+    
+    client.get("/tickets", params={"status": "OPEN"})
+    client.get("/tickets", params={"status": "CLOSED"})
+    
+    assert request.call_count == 2
+
+
+def test_error_response_is_not_cached(client, monkeypatch):
+    request = Mock(return_value=_response(404))
+    monkeypatch.setattr(client.session, "request", request)
+    
+    client.get("/tickets/ticket-999")
+    client.get("/tickets/ticket-999")
+    
+    assert request.call_count == 2
+
+
+def test_write_clears_cache(client, monkeypatch):
+    request = Mock(return_value=_response())
+    monkeypatch.setattr(client.session, "request", request)
+    
+    client.get("/tickets")
+    client.put("/tickets/ticket-001", json={"title": "New title"})
+    client.get("/tickets")
+    
+    assert [call.args[0] for call in request.call_args_list] == ["GET", "PUT", "GET"]
+
+
+def test_failed_write_still_clears_cache(client, monkeypatch):
+    request = Mock(return_value=_response())
+    monkeypatch.setattr(client.session, "request", request)
+    
+    client.get("/tickets")
+    request.return_value = _response(500)
+    client.post("/tickets", json={"title": "t", "description": "d"})
+    request.return_value = _response()
+    client.get("/tickets")
+    
+    assert request.call_count == 3
+
+
+def test_get_racing_a_write_is_not_cached(client, monkeypatch):
+    def request(method, url, **kwargs):
+        if method == "GET" and not raced:
+            # A write finishes while this read is still in flight
+            raced.append(True)
+            client.put("/tickets/ticket-001", json={"title": "New title"})
+        return _response()
+    
+    raced = []
+    session_request = Mock(side_effect=request)
+    monkeypatch.setattr(client.session, "request", session_request)
+    
+    client.get("/tickets")
+    client.get("/tickets")
+    
+    assert [call.args[0] for call in session_request.call_args_list] == ["GET", "PUT", "GET"]